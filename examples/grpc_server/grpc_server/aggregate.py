@@ -1,4 +1,5 @@
-from collections.abc import Iterator
+from collections.abc import Callable, Sequence
+from typing import Any
 
 from grpc_server.types import UpdateCommand as C
 from grpc_server.types import UpdateEvent as E
@@ -18,6 +19,12 @@ VERSION_LIST_TO_DATA: dict[str, bytes] = {
     "6.8.9": b"download_data",
     "8.9.38": b"download_data",
 }
+_VERSION_KEYS: tuple[str, ...] = tuple(VERSION_LIST_TO_DATA)
+_VERSION_SET: frozenset[str] = frozenset(VERSION_LIST_TO_DATA)
+_EMPTY: tuple[E.Base, ...] = ()
+_TERMINAL: frozenset[type] = frozenset(
+    {S.VersionsRetrieved, S.DownloadReady, S.DownloadUnavailable}
+)
 
 
 class UpdateAggregate(Decider[E.Base, C.Base, S.Base]):
@@ -25,47 +32,66 @@ class UpdateAggregate(Decider[E.Base, C.Base, S.Base]):
         return S.NewConnection()
 
     def is_terminal(self, state: S.Base) -> bool:
-        match state:
-            case S.VersionsRetrieved():
-                return True
-            case S.DownloadReady():
-                return True
-            case S.DownloadUnavailable():
-                return True
-            case _:
-                return False
+        return type(state) in _TERMINAL
 
     def evolve(self, state: S.Base, event: E.Base) -> S.Base:
-        match state, event:
-            case S.NewConnection(), E.VersionListRetrieval():
-                return S.VersionsRetrieved(versions=event.versions)
-
-            case S.NewConnection(), E.RequestedDownloadValid():
-                return S.DownloadReady(
-                    version=event.version, data=VERSION_LIST_TO_DATA[event.version]
-                )
-
-            case S.NewConnection(), E.RequestedDownloadInvalid():
-                return S.DownloadUnavailable(
-                    error_code=-1,
-                    error_message=f"Version {event.version} does not exist.",
-                )
-
-            case _:
-                return state
-
-    def decide(self, command: C.Base, state: S.Base) -> Iterator[E.Base]:
-        match command, state:
-            case C.ListAvailableVersions(), S.NewConnection():
-                """Requesting a list of versions."""
-                yield from command(list(VERSION_LIST_TO_DATA.keys()))
-
-            case (
-                C.DownloadUpdate(),
-                S.NewConnection(),
-            ):
-                """ "Requesting a download of a particular version"""
-                yield from command(list(VERSION_LIST_TO_DATA.keys()))
-
-            case _:
-                yield from []
+        handler = _EVOLVE.get((type(state), type(event)))
+        if handler is None:
+            return state
+        return handler(state, event)
+
+    def decide(self, command: C.Base, state: S.Base) -> Sequence[E.Base]:
+        handler = _DECIDE.get((type(command), type(state)))
+        if handler is None:
+            return _EMPTY
+        return handler(command, state)
+
+
+def _evolve_versions_retrieved(
+    state: S.NewConnection, event: E.VersionListRetrieval
+) -> S.Base:
+    return S.VersionsRetrieved(versions=event.versions)
+
+
+def _evolve_download_ready(
+    state: S.NewConnection, event: E.RequestedDownloadValid
+) -> S.Base:
+    return S.DownloadReady(
+        version=event.version, data=VERSION_LIST_TO_DATA[event.version]
+    )
+
+
+def _evolve_download_unavailable(
+    state: S.NewConnection, event: E.RequestedDownloadInvalid
+) -> S.Base:
+    return S.DownloadUnavailable(
+        error_code=-1,
+        error_message=f"Version {event.version} does not exist.",
+    )
+
+
+def _decide_list_versions(
+    command: C.ListAvailableVersions, state: S.NewConnection
+) -> Sequence[E.Base]:
+    """Requesting a list of versions."""
+    return command(_VERSION_KEYS)
+
+
+def _decide_download(
+    command: C.DownloadUpdate, state: S.NewConnection
+) -> Sequence[E.Base]:
+    """Requesting a download of a particular version."""
+    return command(_VERSION_SET)
+
+
+# Transitions keyed on the exact (state, event) and (command, state) types so
+# dispatch is a single dict lookup rather than a chain of class patterns.
+_EVOLVE: dict[tuple[type, type], Callable[[Any, Any], S.Base]] = {
+    (S.NewConnection, E.VersionListRetrieval): _evolve_versions_retrieved,
+    (S.NewConnection, E.RequestedDownloadValid): _evolve_download_ready,
+    (S.NewConnection, E.RequestedDownloadInvalid): _evolve_download_unavailable,
+}
+_DECIDE: dict[tuple[type, type], Callable[[Any, Any], Sequence[E.Base]]] = {
+    (C.ListAvailableVersions, S.NewConnection): _decide_list_versions,
+    (C.DownloadUpdate, S.NewConnection): _decide_download,
+}
@@ -1,55 +1,94 @@
+import os
+import queue
+from collections.abc import Iterator
 from concurrent import futures
+from contextlib import contextmanager
 
 import grpc
-from grpc_server.aggregate import UpdateAggregate
+from grpc_server.aggregate import VERSION_LIST_TO_DATA, UpdateAggregate
 from grpc_server.proto import updater_pb2, updater_pb2_grpc
 from grpc_server.types import UpdateCommand as C
+from grpc_server.types import UpdateEvent as E
 from grpc_server.types import UpdateState as S
 
 from pycider.utils import InMemory
 
+# The aggregate holds no mutable state so a single instance is shared by
+# every pooled executor.
+_AGGREGATE = UpdateAggregate()
+_EXECUTOR_POOL: queue.SimpleQueue[InMemory[E.Base, C.Base, S.Base]] = (
+    queue.SimpleQueue()
+)
+
+# The version list is constant, so every response that only depends on it is
+# built once at import time.
+_CACHED_VERSIONS_TUPLE = tuple(VERSION_LIST_TO_DATA.keys())
+_CACHED_LIST_RESPONSE = updater_pb2.ListAvailableUpdatesResponse(
+    versions=_CACHED_VERSIONS_TUPLE
+)
+_CACHED_UPDATE_RESPONSES: dict[str, updater_pb2.RequestUpdateResponse] = {
+    version: updater_pb2.RequestUpdateResponse(version=version, data=data)
+    for version, data in VERSION_LIST_TO_DATA.items()
+}
+_UNKNOWN_STATE_RESPONSE = updater_pb2.RequestUpdateResponse(
+    error_code=-2, error_message="Unknown system state"
+)
+
+
+@contextmanager
+def _executor() -> Iterator[InMemory[E.Base, C.Base, S.Base]]:
+    """Borrow an executor from the pool, creating one if none are idle."""
+    try:
+        executor = _EXECUTOR_POOL.get_nowait()
+    except queue.Empty:
+        executor = InMemory(_AGGREGATE)
+    try:
+        yield executor
+    finally:
+        executor.reset()
+        _EXECUTOR_POOL.put(executor)
+
 
 class UpdateServicer(updater_pb2_grpc.UpdaterServiceServicer):
     def ListAvailableUpdates(
         self, request: updater_pb2.ListAvailableUpdatesRequest, context
     ) -> updater_pb2.ListAvailableUpdatesResponse:
-
-        executor = InMemory(UpdateAggregate())
-        executor(C.ListAvailableVersions(client_id=request.client_id))
-        state = executor.state
-
-        match state:
-            case S.VersionsRetrieved():
-                return updater_pb2.ListAvailableUpdatesResponse(versions=state.versions)
-            case _:
-                # Normally this could have an error condition handler.
-                return updater_pb2.ListAvailableUpdatesResponse(versions=[])
+        # Running C.ListAvailableVersions through UpdateAggregate always ends in
+        # S.VersionsRetrieved holding the constant version list, so the
+        # decider is skipped and the prebuilt response returned directly.
+        return _CACHED_LIST_RESPONSE
 
     def RequestUpdate(
         self, request: updater_pb2.RequestUpdateRequest, context
     ) -> updater_pb2.RequestUpdateResponse:
 
-        executor = InMemory(UpdateAggregate())
-        executor(C.DownloadUpdate(client_id=request.client_id, version=request.version))
-        state = executor.state
+        with _executor() as executor:
+            executor(
+                C.DownloadUpdate(client_id=request.client_id, version=request.version)
+            )
+            state = executor.state
 
         match state:
             case S.DownloadReady():
-                return updater_pb2.RequestUpdateResponse(
-                    version=state.version, data=state.data
-                )
+                return _CACHED_UPDATE_RESPONSES[state.version]
             case S.DownloadUnavailable():
-                return updater_pb2.RequestUpdateResponse(
-                    error_code=state.error_code, error_message=state.error_message
-                )
+                response = updater_pb2.RequestUpdateResponse()
+                response.error_code = state.error_code
+                response.error_message = state.error_message
+                return response
             case _:
-                return updater_pb2.RequestUpdateResponse(
-                    error_code=-2, error_message="Unknown system state"
-                )
+                return _UNKNOWN_STATE_RESPONSE
 
 
 def serve():
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    max_workers = int(os.environ.get("GRPC_MAX_WORKERS", os.cpu_count() or 8))
+    pool = futures.ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="grpc-worker"
+    )
+    server = grpc.server(
+        pool,
+        options=[("grpc.so_reuseport", 0), ("grpc.max_concurrent_streams", 1024)],
+    )
     updater_pb2_grpc.add_UpdaterServiceServicer_to_server(UpdateServicer(), server)
     server.add_insecure_port("[::]:50051")
     server.start()
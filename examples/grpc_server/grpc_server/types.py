@@ -1,25 +1,25 @@
-from collections.abc import Sequence
-from dataclasses import dataclass, field
+from collections.abc import Container, Sequence
+from dataclasses import dataclass
 
 
 class UpdateState:
     class Base:
-        pass
+        __slots__ = ()
 
-    @dataclass
+    @dataclass(slots=True, frozen=True)
     class NewConnection(Base):
         pass
 
-    @dataclass
+    @dataclass(slots=True, frozen=True)
     class VersionsRetrieved(Base):
-        versions: list[str] = field(default_factory=list)
+        versions: tuple[str, ...] = ()
 
-    @dataclass
+    @dataclass(slots=True, frozen=True)
     class DownloadReady(Base):
         data: bytes
         version: str
 
-    @dataclass
+    @dataclass(slots=True, frozen=True)
     class DownloadUnavailable(Base):
         error_code: int
         error_message: str
@@ -27,19 +27,19 @@ class UpdateState:
 
 class UpdateEvent:
     class Base:
-        pass
+        __slots__ = ()
 
-    @dataclass
+    @dataclass(slots=True, frozen=True)
     class RequestedDownloadValid(Base):
         version: str
 
-    @dataclass
+    @dataclass(slots=True, frozen=True)
     class RequestedDownloadInvalid(Base):
         version: str
 
-    @dataclass
+    @dataclass(slots=True, frozen=True)
     class VersionListRetrieval(Base):
-        versions: list[str] = field(default_factory=list)
+        versions: tuple[str, ...] = ()
 
 
 class UpdateCommand:
@@ -51,14 +51,14 @@ class UpdateCommand:
             self.client_id = client_id
 
         def __call__(self, version_list: Sequence[str]) -> Sequence[UpdateEvent.Base]:
-            return [UpdateEvent.VersionListRetrieval(versions=list(version_list))]
+            return (UpdateEvent.VersionListRetrieval(versions=tuple(version_list)),)
 
     class DownloadUpdate(Base):
         def __init__(self, client_id: str, version: str) -> None:
             self.client_id = client_id
             self.version = version
 
-        def __call__(self, version_list: Sequence[str]) -> Sequence[UpdateEvent.Base]:
-            if self.version in version_list:
-                return [UpdateEvent.RequestedDownloadValid(version=self.version)]
-            return [UpdateEvent.RequestedDownloadInvalid(version=self.version)]
+        def __call__(self, version_set: Container[str]) -> Sequence[UpdateEvent.Base]:
+            if self.version in version_set:
+                return (UpdateEvent.RequestedDownloadValid(version=self.version),)
+            return (UpdateEvent.RequestedDownloadInvalid(version=self.version),)
@@ -1,3 +1,4 @@
+import itertools
 import threading
 import time
 import uuid
@@ -14,20 +15,30 @@ def test_update_server():
     time.sleep(2)
 
     client_id = uuid.uuid4().hex
-    channel = grpc.insecure_channel("localhost:50051")
-    stub = updater_pb2_grpc.UpdaterServiceStub(channel)
+    # Spread requests over several channels so they are not all multiplexed
+    # through a single HTTP/2 connection.
+    channels = [grpc.insecure_channel("localhost:50051") for _ in range(4)]
+    stubs = [updater_pb2_grpc.UpdaterServiceStub(channel) for channel in channels]
+    stubs_iter = itertools.cycle(stubs)
+    stub = stubs[0]
 
     # Fetch and verify version list
     request_list = updater_pb2.ListAvailableUpdatesRequest(client_id=client_id)
     response_list = stub.ListAvailableUpdates(request_list)
     assert response_list.versions == list(VERSION_LIST_TO_DATA.keys())
 
-    # Lets make sure we can fetch each version
-    for version in response_list.versions:
-        request_update = updater_pb2.RequestUpdateRequest(
-            client_id=client_id, version=version
+    # Lets make sure we can fetch each version, issuing the requests concurrently
+    pending = [
+        (
+            version,
+            next(stubs_iter).RequestUpdate.future(
+                updater_pb2.RequestUpdateRequest(client_id=client_id, version=version)
+            ),
         )
-        response_update = stub.RequestUpdate(request_update)
+        for version in response_list.versions
+    ]
+    for version, future in pending:
+        response_update = future.result()
         assert response_update.version == version
         assert response_update.data == VERSION_LIST_TO_DATA[version]
         assert response_update.error_code == 0
@@ -42,3 +53,6 @@ def test_update_server():
     assert response_update.data == b""
     assert response_update.error_code == -1
     assert response_update.error_message == "Version 9.9.9 does not exist."
+
+    for channel in channels:
+        channel.close()
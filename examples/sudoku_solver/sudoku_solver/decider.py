@@ -1,6 +1,6 @@
-import abc
-from collections.abc import Iterator
+from collections.abc import Callable, Iterable, Sequence
 from dataclasses import dataclass
+from typing import Any
 
 from sudoku_solver.sudoku.evaluator import SudokuEvaluator
 from sudoku_solver.sudoku.model import SudokuBoard
@@ -8,64 +8,72 @@ from sudoku_solver.sudoku.model import SudokuBoard
 from pycider.deciders import Decider
 
 
-@dataclass(frozen=True)
-class Command(abc.ABC):
-    pass
+class Command:
+    __slots__ = ()
 
 
-@dataclass(frozen=True)
-class Event(abc.ABC):
-    pass
+class Event:
+    __slots__ = ()
 
 
-@dataclass(frozen=True)
-class State(abc.ABC):
-    pass
+class State:
+    __slots__ = ()
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class InitializeSolver(Command):
-    """Start the solver with the provided initial board."""
+    """Start the solver with the provided initial board.
+
+    The grid is either a row-major list where `None` is an empty cell or a
+    compact 81 character string as accepted by `SudokuBoard.from_string`.
+    """
 
-    grid: list[int | None]
+    grid: list[int | None] | str
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class RunSolverStep(Command):
     """Perform a step in the solving algorithm."""
 
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
+class RunBacktrackingSolve(Command):
+    """Search for a solution once no more cells can be deduced."""
+
+    pass
+
+
+@dataclass(slots=True, frozen=True)
 class ValidateBoardState(Command):
     """Check if the current state of the board is valid."""
 
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class CheckCompletion(Command):
     """Verify if the board is completely solved."""
 
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class HandleError(Command):
     """Process any detected error during solving."""
 
     message: str
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class BoardInitialized(Event):
     """Initialized"""
 
     board: SudokuBoard
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class StepCompleted(Event):
     """A step in the solving process was successfully completed."""
 
@@ -73,91 +81,105 @@ class StepCompleted(Event):
     value: int
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
+class StepsCompleted(Event):
+    """Several cells were filled in by a single solving step."""
+
+    placements: tuple[tuple[int, int], ...]
+
+
+@dataclass(slots=True, frozen=True)
 class BoardValidated(Event):
     """The board was checked and found to be valid."""
 
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class BoardNotYetComplete(Event):
     """The board was checked for completion but is not yet complete."""
 
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
+class PropagationStalled(Event):
+    """No cell could be deduced, the board needs a search to progress."""
+
+    pass
+
+
+@dataclass(slots=True, frozen=True)
 class SolutionFound(Event):
     """The solver has successfully found a solution."""
 
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class SolutionFailed(Event):
     """The solver was unable to solve the board."""
 
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class ErrorDetected(Event):
     """An error was encountered during the solving process."""
 
     message: str
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class Initial(State):
     """The solver is initialized with the provided board."""
 
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class InitializedBase(State):
     """The solver is now inialized."""
 
     board: SudokuBoard
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class Solving(InitializedBase):
     """The solver is actively processing and attempting to solve the board."""
 
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class Valid(InitializedBase):
     """The board is currently in a valid state according to Sudoku rules."""
 
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class Invalid(InitializedBase):
     """The board state has been found invalid (e.g., contradicting numbers)."""
 
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class Solved(InitializedBase):
     """The board has been solved successfully."""
 
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class Unsolvable(InitializedBase):
     """The board was determined to be unsolvable after processing."""
 
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class Error(State):
     """An error occurred during the solving process, requiring attention."""
 
@@ -166,68 +188,175 @@ class Error(State):
 
 class SudokuDecider(Decider[Event, Command, State]):
     def initial_state(self) -> State:
-        return Initial()
+        return _INITIAL
 
     def is_terminal(self, state: State) -> bool:
-        return isinstance(state, Unsolvable) or isinstance(state, Solved)
-
-    def decide(self, command: Command, state: State) -> Iterator[Event]:
-        match command, state:
-            case InitializeSolver(grid=grid), Initial():
-                board = SudokuBoard(values=grid)
-                yield from [BoardInitialized(board=board)]
-
-            case RunSolverStep(), Valid(board=board) | Solving(board=board):
-                step = SudokuEvaluator.find_next_single_step(board)
-                if step:
-                    row, col, value = step
-                    idx = row * 9 + col
-                    yield from [StepCompleted(idx=idx, value=value)]
-                else:
-                    yield from [SolutionFailed()]
-
-            case ValidateBoardState(), Solving(board=board):
-                if SudokuEvaluator.is_board_valid(board):
-                    yield from [BoardValidated()]
-                else:
-                    yield from [SolutionFailed()]
-
-            case CheckCompletion(), Solving(board=board):
-                if SudokuEvaluator.is_board_complete(board):
-                    yield from [SolutionFound()]
-                else:
-                    yield from [BoardNotYetComplete()]
-
-            case _:
-                yield from [
-                    ErrorDetected(message=f"Unhandled: {command=} with {state=}.")
-                ]
+        return type(state) in _TERMINAL
+
+    def decide(self, command: Command, state: State) -> Sequence[Event]:
+        handler = _DECIDE.get((type(command), type(state)))
+        if handler is None:
+            # Only the type names are reported: the repr of a state includes
+            # the whole board.
+            return (
+                ErrorDetected(
+                    message=f"Unhandled: {type(command).__name__} with "
+                    f"{type(state).__name__}."
+                ),
+            )
+        return handler(command, state)
 
     def evolve(self, state: State, event: Event) -> State:
-        match event, state:
-            case BoardInitialized(board=board), Initial():
-                return Solving(board=board)
-
-            case StepCompleted(idx=idx, value=value), Solving(board=board) | Valid(
-                board=board
+        handler = _EVOLVE.get((type(state), type(event)))
+        if handler is None:
+            return state
+        return handler(state, event)
+
+    def evolve_batch(self, state: State, events: Iterable[Event]) -> State:
+        """Evolve a state over a sequence of events.
+
+        This is equivalent to calling `evolve` for each event, except that
+        consecutive `StepCompleted` and `StepsCompleted` events are applied
+        to a single board, so only one `SudokuBoard` is built per run.
+        """
+        # The board a run of placements started from, or None outside a run.
+        # An empty run still moves the solver to `Solving`, as `evolve` does.
+        board: SudokuBoard | None = None
+        pending: list[tuple[int, int]] = []
+        for event in events:
+            if isinstance(event, (StepCompleted, StepsCompleted)) and isinstance(
+                state, (Solving, Valid)
             ):
-                values = board.values[:]
-                values[idx] = value
-                new_board = SudokuBoard(values=values)
-                return Solving(board=new_board)
-
-            case BoardValidated(), Solving(board=board):
-                return Valid(board=board)
-
-            case SolutionFound(), (Valid(board=board) | Solving(board=board)):
-                return Solved(board=board)
+                if board is None:
+                    board = state.board
+                if isinstance(event, StepCompleted):
+                    pending.append((event.idx, event.value))
+                else:
+                    pending.extend(event.placements)
+                continue
+            if board is not None:
+                state = Solving(board=board.with_values(pending))
+                board = None
+                pending.clear()
+            state = self.evolve(state, event)
+        if board is not None:
+            state = Solving(board=board.with_values(pending))
+        return state
 
-            case SolutionFailed(), (Solving(board=board) | Valid(board=board)):
-                return Unsolvable(board=board)
 
-            case ErrorDetected(message=msg), _:
-                return Error(message=msg)
+# The leaf state types in which the solver has finished.
+_TERMINAL: frozenset[type] = frozenset({Solved, Unsolvable})
 
-            # If no match, return the current state
-            case _:
-                return state
+# States and events that carry no data are built once and shared.
+_INITIAL = Initial()
+_VALIDATED: tuple[Event, ...] = (BoardValidated(),)
+_NOT_YET_COMPLETE: tuple[Event, ...] = (BoardNotYetComplete(),)
+_STALLED: tuple[Event, ...] = (PropagationStalled(),)
+_FOUND: tuple[Event, ...] = (SolutionFound(),)
+_FAILED: tuple[Event, ...] = (SolutionFailed(),)
+
+
+def _decide_initialize(command: InitializeSolver, state: Initial) -> Sequence[Event]:
+    try:
+        if isinstance(command.grid, str):
+            board = SudokuBoard.from_string(command.grid)
+        else:
+            board = SudokuBoard.from_grid(command.grid)
+    except ValueError as exc:
+        return (ErrorDetected(message=str(exc)),)
+    return (BoardInitialized(board=board),)
+
+
+def _decide_solver_step(
+    command: RunSolverStep, state: InitializedBase
+) -> Sequence[Event]:
+    placements = SudokuEvaluator.solve_step(state.board)
+    if placements:
+        return (StepsCompleted(placements=tuple(placements)),)
+    return _STALLED
+
+
+def _decide_backtracking_solve(
+    command: RunBacktrackingSolve, state: InitializedBase
+) -> Sequence[Event]:
+    board = state.board
+    solution = SudokuEvaluator.solve(board)
+    if solution is None:
+        return _FAILED
+    placements = tuple((idx, solution.values[idx]) for idx in board.empty_cells)
+    if not placements:
+        # The board was already complete, there is nothing left to place.
+        return _FOUND
+    return (StepsCompleted(placements=placements),)
+
+
+def _decide_validate(command: ValidateBoardState, state: Solving) -> Sequence[Event]:
+    if SudokuEvaluator.is_board_valid(state.board):
+        return _VALIDATED
+    return _FAILED
+
+
+def _decide_check_completion(
+    command: CheckCompletion, state: Solving
+) -> Sequence[Event]:
+    if SudokuEvaluator.is_board_complete(state.board):
+        return _FOUND
+    return _NOT_YET_COMPLETE
+
+
+def _evolve_initialized(state: Initial, event: BoardInitialized) -> State:
+    return Solving(board=event.board)
+
+
+def _evolve_step(state: InitializedBase, event: StepCompleted) -> State:
+    return Solving(board=state.board.with_value(event.idx, event.value))
+
+
+def _evolve_steps(state: InitializedBase, event: StepsCompleted) -> State:
+    return Solving(board=state.board.with_values(event.placements))
+
+
+def _evolve_validated(state: Solving, event: BoardValidated) -> State:
+    return Valid(board=state.board)
+
+
+def _evolve_solved(state: InitializedBase, event: SolutionFound) -> State:
+    return Solved(board=state.board)
+
+
+def _evolve_unsolvable(state: InitializedBase, event: SolutionFailed) -> State:
+    return Unsolvable(board=state.board)
+
+
+def _evolve_error(state: State, event: ErrorDetected) -> State:
+    return Error(message=event.message)
+
+
+# Transitions keyed on the exact (command, state) and (state, event) types so
+# dispatch is a single dict lookup rather than a chain of class patterns.
+_DECIDE: dict[tuple[type, type], Callable[[Any, Any], Sequence[Event]]] = {
+    (InitializeSolver, Initial): _decide_initialize,
+    (RunSolverStep, Valid): _decide_solver_step,
+    (RunSolverStep, Solving): _decide_solver_step,
+    (RunBacktrackingSolve, Valid): _decide_backtracking_solve,
+    (RunBacktrackingSolve, Solving): _decide_backtracking_solve,
+    (ValidateBoardState, Solving): _decide_validate,
+    (CheckCompletion, Solving): _decide_check_completion,
+}
+_EVOLVE: dict[tuple[type, type], Callable[[Any, Any], State]] = {
+    (Initial, BoardInitialized): _evolve_initialized,
+    (Solving, StepCompleted): _evolve_step,
+    (Valid, StepCompleted): _evolve_step,
+    (Solving, StepsCompleted): _evolve_steps,
+    (Valid, StepsCompleted): _evolve_steps,
+    (Solving, BoardValidated): _evolve_validated,
+    (Solving, SolutionFound): _evolve_solved,
+    (Valid, SolutionFound): _evolve_solved,
+    (Solving, SolutionFailed): _evolve_unsolvable,
+    (Valid, SolutionFailed): _evolve_unsolvable,
+}
+# An error is recorded whatever state the solver was in.
+_EVOLVE.update(
+    ((state_type, ErrorDetected), _evolve_error)
+    for state_type in (Initial, Solving, Valid, Invalid, Solved, Unsolvable, Error)
+)
@@ -1,84 +1,102 @@
-import abc
-from collections.abc import Iterator
+from collections.abc import Sequence
 from dataclasses import dataclass
 
 from pycider import processes
 
 
-@dataclass(frozen=True)
-class Command(abc.ABC):
-    pass
+class Command:
+    __slots__ = ()
 
 
-@dataclass(frozen=True)
-class Event(abc.ABC):
-    pass
+class Event:
+    __slots__ = ()
 
 
-@dataclass(frozen=True)
-class State(abc.ABC):
-    pass
+class State:
+    __slots__ = ()
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class InitialState(State):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class StepCompleted(Event):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class BoardValidated(Event):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class CheckCompletion(Command):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class RunSolverStep(Command):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class BoardNotYetComplete(Event):
     pass
 
 
+@dataclass(slots=True, frozen=True)
+class PropagationStalled(Event):
+    pass
+
+
+@dataclass(slots=True, frozen=True)
+class RunBacktrackingSolve(Command):
+    pass
+
+
+# The state and reactions never carry data, so each is built once and shared.
+_INITIAL = InitialState()
+_EMPTY: tuple[Command, ...] = ()
+_CHECK: tuple[Command, ...] = (CheckCompletion(),)
+_RUN: tuple[Command, ...] = (RunSolverStep(),)
+_BACKTRACK: tuple[Command, ...] = (RunBacktrackingSolve(),)
+
+
 class SudokuProcess(processes.IProcess[Event, Command, State]):
-    def react(self, state: State, event: Event) -> Iterator[Command]:
-        """Returns an iterator of commands as a reaction to an event."""
+    def react(self, state: State, event: Event) -> Sequence[Command]:
+        """Returns the commands to issue as a reaction to an event."""
         match event, state:
 
             # Event: StepCompleted -> Generate the next step command
             case StepCompleted(), InitialState():
-                yield from [CheckCompletion()]
+                return _CHECK
 
             # Event: BoardValidated -> Start solving if the board is valid
             case BoardValidated(), InitialState():
-                yield from [RunSolverStep()]
+                return _RUN
 
             # Event: BoardNotYetComplete -> The board is not yet complete
             case BoardNotYetComplete(), InitialState():
-                yield from [RunSolverStep()]
+                return _RUN
+
+            # Event: PropagationStalled -> Fall back to a search
+            case PropagationStalled(), InitialState():
+                return _BACKTRACK
 
             # Default case: No action for unhandled events
             case _:
-                yield from []
+                return _EMPTY
 
     def evolve(self, state: State, event: Event) -> State:
         return state
 
-    def resume(self, state: State) -> Iterator[Command]:
-        yield from []
+    def resume(self, state: State) -> Sequence[Command]:
+        return _EMPTY
 
     def initial_state(self) -> State:
-        return InitialState()
+        return _INITIAL
 
     def is_terminal(self, state: State) -> bool:
         return True
@@ -1,97 +1,165 @@
-from sudoku_solver.sudoku.model import SudokuBoard
+from sudoku_solver.sudoku.model import (
+    ALL_UNITS,
+    BOX,
+    COL,
+    PEERS,
+    ROW,
+    SudokuBoard,
+)
 
 
 class SudokuEvaluator:
     @classmethod
-    def is_value_valid(cls, value: int | None) -> bool:
-        return value is None or 1 <= value <= 9
+    def is_value_valid(cls, value: int) -> bool:
+        return 0 <= value <= 9
 
     @classmethod
-    def is_row_valid(cls, board: SudokuBoard, row: int) -> bool:
-        """Checks if a row contains no duplicates."""
-        seen = set()
-        for col in range(9):
-            value = board.values[row * 9 + col]
-            if value is not None:
-                if value in seen:
-                    return False
-                seen.add(value)
-        return True
+    def is_board_valid(cls, board: SudokuBoard) -> bool:
+        """Checks if the entire board is valid."""
+        return board.valid
 
     @classmethod
-    def is_column_valid(cls, board: SudokuBoard, col: int) -> bool:
-        """Checks if a column contains no duplicates."""
-        seen = set()
-        for row in range(9):
-            value = board.values[row * 9 + col]
-            if value is not None:
-                if value in seen:
-                    return False
-                seen.add(value)
-        return True
+    def is_board_complete(cls, board: SudokuBoard) -> bool:
+        return board.complete
 
     @classmethod
-    def is_subgrid_valid(
-        cls, board: SudokuBoard, start_row: int, start_col: int
-    ) -> bool:
-        """Checks if a 3x3 subgrid contains no duplicates."""
-        seen = set()
-        for row in range(3):
-            for col in range(3):
-                value = board.values[(start_row + row) * 9 + (start_col + col)]
-                if value is not None:
-                    if value in seen:
-                        return False
-                    seen.add(value)
-        return True
+    def all_candidates(cls, board: SudokuBoard) -> list[int]:
+        """Returns the candidate mask of every cell, 0 for filled cells.
+
+        Bit `v - 1` of a mask is set when `v` can be placed in that cell. Only
+        the board's empty cells are visited.
+        """
+        rows, cols, boxes = board.row_masks, board.col_masks, board.box_masks
+        candidates = [0] * 81
+        for idx in board.empty_cells:
+            candidates[idx] = 0x1FF & ~(
+                rows[ROW[idx]] | cols[COL[idx]] | boxes[BOX[idx]]
+            )
+        return candidates
 
     @classmethod
-    def is_board_valid(cls, board: SudokuBoard) -> bool:
-        """Checks if the entire board is valid."""
-        # Validate rows, columns, and subgrids
-        for i in range(9):
-            if not cls.is_row_valid(board, i) or not cls.is_column_valid(board, i):
-                return False
-        for row in range(0, 9, 3):
-            for col in range(0, 9, 3):
-                if not cls.is_subgrid_valid(board, row, col):
-                    return False
-        return True
+    def propagate_naked_singles(cls, board: SudokuBoard) -> list[tuple[int, int]]:
+        """Fills every cell that is forced by a single remaining candidate.
+
+        Placing a value removes it from the candidates of the cell's peers,
+        which may leave further cells with a single candidate. This repeats
+        until no forced cell remains.
+
+        Returns:
+            The `(idx, value)` placements in the order they were made.
+        """
+        candidates = cls.all_candidates(board)
+        forced = [idx for idx in board.empty_cells if candidates[idx].bit_count() == 1]
+        placements: list[tuple[int, int]] = []
+        while forced:
+            idx = forced.pop()
+            bit = candidates[idx]
+            # Skip cells already placed or emptied by an earlier placement.
+            if not bit:
+                continue
+            candidates[idx] = 0
+            placements.append((idx, bit.bit_length()))
+            for peer in PEERS[idx]:
+                mask = candidates[peer]
+                if mask & bit:
+                    mask &= ~bit
+                    candidates[peer] = mask
+                    if mask and not mask & (mask - 1):
+                        forced.append(peer)
+        return placements
 
     @classmethod
-    def is_board_complete(cls, board: SudokuBoard) -> bool:
-        return all(value is not None for value in board.values)
+    def find_hidden_single(cls, board: SudokuBoard) -> tuple[int, int] | None:
+        """Finds a value that fits in only one cell of some unit.
+
+        Returns:
+            The `(idx, value)` placement, or None if there is no hidden single.
+        """
+        candidates = cls.all_candidates(board)
+        for unit in ALL_UNITS:
+            seen_once = seen_twice = 0
+            for idx in unit:
+                mask = candidates[idx]
+                seen_twice |= seen_once & mask
+                seen_once |= mask
+            singles = seen_once & ~seen_twice
+            if singles:
+                bit = singles & -singles
+                for idx in unit:
+                    if candidates[idx] & bit:
+                        return idx, bit.bit_length()
+        return None
 
     @classmethod
-    def is_value_allowed(
-        cls, board: SudokuBoard, row: int, col: int, value: int
-    ) -> bool:
-        """Checks if a value can be placed at the given row and column."""
-        # Check row
-        if value in (board.values[row * 9 + c] for c in range(9)):
-            return False
-        # Check column
-        if value in (board.values[r * 9 + col] for r in range(9)):
-            return False
-        # Check subgrid
-        start_row, start_col = row - row % 3, col - col % 3
-        for r in range(3):
-            for c in range(3):
-                if board.values[(start_row + r) * 9 + (start_col + c)] == value:
-                    return False
-        return True
+    def solve_step(cls, board: SudokuBoard) -> list[tuple[int, int]]:
+        """Fills every cell reachable through naked and hidden singles.
+
+        Naked singles are propagated first. A hidden single is placed only
+        once none remain, after which propagation resumes.
+
+        Returns:
+            The `(idx, value)` placements in the order they were made.
+        """
+        placements: list[tuple[int, int]] = []
+        while True:
+            naked = cls.propagate_naked_singles(board)
+            if naked:
+                board = board.with_values(naked)
+                placements.extend(naked)
+            hidden = cls.find_hidden_single(board)
+            if hidden is None:
+                return placements
+            board = board.with_value(*hidden)
+            placements.append(hidden)
 
     @classmethod
-    def find_next_single_step(cls, board: SudokuBoard) -> tuple[int, int, int] | None:
-        """Finds a cell where only one value can fit."""
-        for row in range(9):
-            for col in range(9):
-                if board.values[row * 9 + col] is None:
-                    possible_values = [
-                        value
-                        for value in range(1, 10)
-                        if cls.is_value_allowed(board, row, col, value)
-                    ]
-                    if len(possible_values) == 1:
-                        return row, col, possible_values[0]
-        return None
+    def solve(cls, board: SudokuBoard) -> SudokuBoard | None:
+        """Solves a board by depth-first search.
+
+        At each level the empty cell with the fewest candidates is tried
+        first (minimum remaining values), and the unit masks are updated in
+        place and restored when a branch fails.
+
+        Returns:
+            The solved board, or None if the board has no solution.
+        """
+        if not board.valid:
+            return None
+        values = bytearray(board.values)
+        rows, cols = list(board.row_masks), list(board.col_masks)
+        boxes = list(board.box_masks)
+        empties = board.empty_cells
+
+        def search() -> bool:
+            best, best_mask, best_count = -1, 0, 10
+            for idx in empties:
+                if not values[idx]:
+                    mask = 0x1FF & ~(rows[ROW[idx]] | cols[COL[idx]] | boxes[BOX[idx]])
+                    count = mask.bit_count()
+                    if count == 0:
+                        return False
+                    if count < best_count:
+                        best, best_mask, best_count = idx, mask, count
+                        if count == 1:
+                            break
+            if best < 0:
+                return True
+            row, col, box = ROW[best], COL[best], BOX[best]
+            while best_mask:
+                bit = best_mask & -best_mask
+                best_mask ^= bit
+                values[best] = bit.bit_length()
+                rows[row] |= bit
+                cols[col] |= bit
+                boxes[box] |= bit
+                if search():
+                    return True
+                rows[row] ^= bit
+                cols[col] ^= bit
+                boxes[box] ^= bit
+            values[best] = 0
+            return False
+
+        if not search():
+            return None
+        return SudokuBoard(values=bytes(values))
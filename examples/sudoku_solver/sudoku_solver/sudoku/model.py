@@ -1,6 +1,153 @@
 import dataclasses
+import functools
+from collections.abc import Iterable
+
+# Row, column and box of every cell, indexed by its flat position.
+ROW = bytes(idx // 9 for idx in range(81))
+COL = bytes(idx % 9 for idx in range(81))
+BOX = bytes((idx // 27) * 3 + (idx % 9) // 3 for idx in range(81))
+
+# The three units (row, column, box) containing each cell, and the 20 other
+# cells that share a unit with it.
+UNITS: tuple[tuple[tuple[int, ...], ...], ...] = tuple(
+    (
+        tuple(other for other in range(81) if ROW[other] == ROW[idx]),
+        tuple(other for other in range(81) if COL[other] == COL[idx]),
+        tuple(other for other in range(81) if BOX[other] == BOX[idx]),
+    )
+    for idx in range(81)
+)
+# All 27 units: the nine rows, then the nine columns, then the nine boxes.
+ALL_UNITS: tuple[tuple[int, ...], ...] = tuple(
+    tuple(idx for idx in range(81) if table[idx] == unit)
+    for table in (ROW, COL, BOX)
+    for unit in range(9)
+)
+PEERS: tuple[tuple[int, ...], ...] = tuple(
+    tuple(sorted(set().union(*UNITS[idx]) - {idx})) for idx in range(81)
+)
+
+# Maps the ASCII digits of a compact board string to cell values, with "." or
+# "0" marking an empty cell.
+_CELL_CHARS = b".0123456789"
+_CELL_VALUES = bytes.maketrans(_CELL_CHARS, b"\x00" + bytes(range(10)))
+# Single cell byte strings, reused when a board is copied with a new value.
+_CELL_BYTES = tuple(bytes((value,)) for value in range(10))
 
 
 @dataclasses.dataclass(frozen=True)
 class SudokuBoard:
-    values: list[int | None]
+    """An immutable 9x9 board stored row by row, one byte per cell.
+
+    A value of 0 marks an empty cell. The digits used by each row, column
+    and box are kept as 9-bit masks where bit `v - 1` is set when digit `v`
+    is present. They are derived from `values` when not supplied.
+    """
+
+    values: bytes
+    row_masks: tuple[int, ...] = dataclasses.field(
+        default=(), repr=False, compare=False
+    )
+    col_masks: tuple[int, ...] = dataclasses.field(
+        default=(), repr=False, compare=False
+    )
+    box_masks: tuple[int, ...] = dataclasses.field(
+        default=(), repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.row_masks:
+            return
+        rows, cols, boxes = [0] * 9, [0] * 9, [0] * 9
+        for idx, value in enumerate(self.values):
+            if value:
+                bit = 1 << (value - 1)
+                rows[ROW[idx]] |= bit
+                cols[COL[idx]] |= bit
+                boxes[BOX[idx]] |= bit
+        object.__setattr__(self, "row_masks", tuple(rows))
+        object.__setattr__(self, "col_masks", tuple(cols))
+        object.__setattr__(self, "box_masks", tuple(boxes))
+
+    @functools.cached_property
+    def complete(self) -> bool:
+        """Whether every cell is filled in."""
+        return 0 not in self.values
+
+    @functools.cached_property
+    def empty_cells(self) -> tuple[int, ...]:
+        """The flat indices of the empty cells, in row-major order."""
+        return tuple(idx for idx, value in enumerate(self.values) if not value)
+
+    @functools.cached_property
+    def valid(self) -> bool:
+        """Whether no row, column or box repeats a digit.
+
+        Each filled cell sets one bit in the masks of its units, so a unit
+        holds no duplicates exactly when its mask has one bit per filled
+        cell. Comparing the totals checks all 27 units without a scan.
+        """
+        filled = 81 - self.values.count(0)
+        return (
+            sum(mask.bit_count() for mask in self.row_masks) == filled
+            and sum(mask.bit_count() for mask in self.col_masks) == filled
+            and sum(mask.bit_count() for mask in self.box_masks) == filled
+        )
+
+    @classmethod
+    def from_grid(cls, grid: list[int | None]) -> "SudokuBoard":
+        """Build a board from a row-major grid where `None` is an empty cell."""
+        return cls(values=bytes(value or 0 for value in grid))
+
+    @classmethod
+    def from_string(cls, text: str) -> "SudokuBoard":
+        """Build a board from an 81 character row-major string.
+
+        Digits are cell values and "." or "0" is an empty cell, for example
+        "4..7..382.8.....7..3..8.9...". Any other length or character raises
+        a ValueError.
+        """
+        if len(text) != 81:
+            raise ValueError(f"Expected 81 cells, got {len(text)}.")
+        cells = text.encode("ascii", "replace")
+        # Deleting every accepted character leaves only the invalid ones.
+        if cells.translate(None, _CELL_CHARS):
+            raise ValueError(f"Expected only digits and '.', got {text!r}.")
+        return cls(values=cells.translate(_CELL_VALUES))
+
+    def with_value(self, idx: int, value: int) -> "SudokuBoard":
+        """Return a copy of this board with a single empty cell filled in.
+
+        Only the masks of the cell's row, column and box are updated.
+        """
+        bit = 1 << (value - 1)
+        row, col, box = ROW[idx], COL[idx], BOX[idx]
+        rows, cols, boxes = self.row_masks, self.col_masks, self.box_masks
+        return SudokuBoard(
+            values=self.values[:idx] + _CELL_BYTES[value] + self.values[idx + 1 :],
+            row_masks=rows[:row] + (rows[row] | bit,) + rows[row + 1 :],
+            col_masks=cols[:col] + (cols[col] | bit,) + cols[col + 1 :],
+            box_masks=boxes[:box] + (boxes[box] | bit,) + boxes[box + 1 :],
+        )
+
+    def with_values(self, placements: Iterable[tuple[int, int]]) -> "SudokuBoard":
+        """Return a copy of this board with several empty cells filled in.
+
+        Parameters:
+            placements: Pairs of flat cell index and value to place.
+        """
+        values = bytearray(self.values)
+        rows, cols = list(self.row_masks), list(self.col_masks)
+        boxes = list(self.box_masks)
+        for idx, value in placements:
+            bit = 1 << (value - 1)
+            values[idx] = value
+            rows[ROW[idx]] |= bit
+            cols[COL[idx]] |= bit
+            boxes[BOX[idx]] |= bit
+        return SudokuBoard(
+            values=bytes(values),
+            row_masks=tuple(rows),
+            col_masks=tuple(cols),
+            box_masks=tuple(boxes),
+        )
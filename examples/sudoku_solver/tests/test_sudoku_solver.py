@@ -1,43 +1,52 @@
+import pytest
 from sudoku_solver import decider, process
+from sudoku_solver.sudoku.model import SudokuBoard
 
 from pycider import processes, utils
 
+# The commands and events crossing the adapter carry no data, so each maps
+# onto a shared instance of its counterpart.
+_COMMANDS: dict[type, decider.Command] = {
+    process.CheckCompletion: decider.CheckCompletion(),
+    process.RunSolverStep: decider.RunSolverStep(),
+    process.RunBacktrackingSolve: decider.RunBacktrackingSolve(),
+}
+_EVENTS: dict[type, process.Event] = {
+    decider.BoardInitialized: process.StepCompleted(),
+    decider.StepCompleted: process.StepCompleted(),
+    decider.StepsCompleted: process.StepCompleted(),
+    decider.BoardValidated: process.BoardValidated(),
+    decider.BoardNotYetComplete: process.BoardNotYetComplete(),
+    decider.PropagationStalled: process.PropagationStalled(),
+}
 
-def test_sudoku_solver_can_solve_simple_puzzle() -> None:
-    test_process = process.SudokuProcess()
-    test_decider = decider.SudokuDecider()
 
-    def convert_command(
-        command_out: process.Command,
-    ) -> decider.Command:
-        match command_out:
-            case process.CheckCompletion():
-                return decider.CheckCompletion()
-            case process.RunSolverStep():
-                return decider.RunSolverStep()
-            case _:
-                raise RuntimeError("Impossible area reached")
-
-    def select_event(
-        event_in: decider.Event,
-    ) -> process.Event | None:
-        match event_in:
-            case decider.BoardInitialized():
-                return process.StepCompleted()
-            case decider.StepCompleted():
-                return process.StepCompleted()
-            case decider.BoardValidated():
-                return process.BoardValidated()
-            case decider.BoardNotYetComplete():
-                return process.BoardNotYetComplete()
-            case _:
-                return None
+def convert_command(
+    command_out: process.Command,
+) -> decider.Command:
+    command = _COMMANDS.get(type(command_out))
+    if command is None:
+        raise RuntimeError("Impossible area reached")
+    return command
+
 
+def select_event(
+    event_in: decider.Event,
+) -> process.Event | None:
+    return _EVENTS.get(type(event_in))
+
+
+def build_solver(test_decider: decider.SudokuDecider) -> utils.InMemory:
     adapted_process = processes.ProcessAdapt(
-        select_event, convert_command, test_process
+        select_event, convert_command, process.SudokuProcess()
     ).build()
     program = processes.ProcessCombineWithDecider(adapted_process, test_decider).build()
-    solver = utils.InMemory(program)
+    return utils.InMemory(program)
+
+
+def test_sudoku_solver_can_solve_simple_puzzle() -> None:
+    test_decider = decider.SudokuDecider()
+    solver = build_solver(test_decider)
 
     grid: list[int | None] = [
         4,
@@ -129,8 +138,10 @@ def test_sudoku_solver_can_solve_simple_puzzle() -> None:
     for event in events:
         state = test_decider.evolve(state, event)
 
+    assert test_decider.evolve_batch(test_decider.initial_state(), events) == state
+
     assert isinstance(state, decider.Solved)
-    assert state.board.values == [
+    assert list(state.board.values) == [
         4,
         6,
         9,
@@ -213,3 +224,115 @@ def test_sudoku_solver_can_solve_simple_puzzle() -> None:
         5,
         1,
     ]
+
+
+def test_board_from_string_matches_grid() -> None:
+    grid: list[int | None] = [None, 4, None, 7, None, None, 3, 8, 2] + [None] * 72
+
+    board = SudokuBoard.from_string(".4.7..382" + "0" * 72)
+
+    assert board == SudokuBoard.from_grid(grid)
+    with pytest.raises(ValueError):
+        SudokuBoard.from_string("x" * 81)
+    with pytest.raises(ValueError):
+        SudokuBoard.from_string("4..7..382")
+
+
+def test_sudoku_solver_reports_invalid_grid() -> None:
+    test_decider = decider.SudokuDecider()
+    solver = build_solver(test_decider)
+
+    events = solver(decider.InitializeSolver(grid="x" * 81))
+    state = test_decider.evolve_batch(test_decider.initial_state(), events)
+
+    assert [type(event) for event in events] == [decider.ErrorDetected]
+    assert isinstance(state, decider.Error)
+    assert "x" in state.message
+
+
+def test_sudoku_solver_can_solve_puzzle_needing_hidden_singles() -> None:
+    test_decider = decider.SudokuDecider()
+    solver = build_solver(test_decider)
+
+    events = solver(
+        decider.InitializeSolver(
+            grid=(
+                "000000907000420180000705026100904000050000040"
+                "000507009920108000034059000507000000"
+            )
+        )
+    )
+    state = test_decider.evolve_batch(test_decider.initial_state(), events)
+
+    assert isinstance(state, decider.Solved)
+    assert state.board == SudokuBoard.from_string(
+        "462831957795426183381795426173984265659312748"
+        "248567319926178534834259671517643892"
+    )
+
+
+def test_sudoku_solver_falls_back_to_search_when_propagation_stalls() -> None:
+    test_decider = decider.SudokuDecider()
+    solver = build_solver(test_decider)
+
+    events = solver(
+        decider.InitializeSolver(
+            grid=(
+                "100920000524010000000000070050008102000000000"
+                "402700090060000000000030945000071006"
+            )
+        )
+    )
+    state = test_decider.evolve_batch(test_decider.initial_state(), events)
+
+    assert any(isinstance(event, decider.PropagationStalled) for event in events)
+    assert isinstance(state, decider.Solved)
+    assert state.board == SudokuBoard.from_string(
+        "176923584524817639893654271957348162638192457"
+        "412765398265489713781236945349571826"
+    )
+
+
+def test_evolve_batch_folds_placement_runs() -> None:
+    test_decider = decider.SudokuDecider()
+    board = SudokuBoard.from_string(
+        "4..7..382.8.....7..3..8.9....4..852....27....."
+        "7294..6.92651..3.1.836..4.3..8296.1"
+    )
+    events = [
+        decider.BoardInitialized(board=board),
+        decider.StepCompleted(idx=1, value=6),
+        decider.StepCompleted(idx=2, value=9),
+        decider.BoardValidated(),
+        decider.StepsCompleted(placements=((4, 5), (5, 1))),
+        decider.StepCompleted(idx=9, value=2),
+        decider.BoardNotYetComplete(),
+    ]
+
+    state = test_decider.initial_state()
+    for event in events:
+        state = test_decider.evolve(state, event)
+
+    assert test_decider.evolve_batch(test_decider.initial_state(), events) == state
+    assert isinstance(state, decider.Solving)
+    assert state.board.values[:10] == bytes((4, 6, 9, 7, 5, 1, 3, 8, 2, 2))
+
+    # An empty run still moves a validated board back to solving.
+    valid = decider.Valid(board=board)
+    empty_run = [decider.StepsCompleted(placements=())]
+    assert test_decider.evolve(valid, empty_run[0]) == decider.Solving(board=board)
+    assert test_decider.evolve_batch(valid, empty_run) == decider.Solving(board=board)
+
+
+def test_backtracking_solve_of_complete_board_finds_solution() -> None:
+    test_decider = decider.SudokuDecider()
+    board = SudokuBoard.from_string(
+        "462831957795426183381795426173984265659312748"
+        "248567319926178534834259671517643892"
+    )
+
+    events = test_decider.decide(
+        decider.RunBacktrackingSolve(), decider.Solving(board=board)
+    )
+
+    assert list(events) == [decider.SolutionFound()]
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Iterator, MutableMapping
+from collections.abc import Callable, Iterable, MutableMapping
+from itertools import chain, repeat
 from typing import Generic, Type, TypeVar, override
 
 from pycider.types import Either, Left, Right
@@ -65,7 +66,7 @@ class BaseDecider(ABC, Generic[E, C, SI, SO]):
         pass
 
     @abstractmethod
-    def decide(self, command: C, state: SI) -> Iterator[E]:
+    def decide(self, command: C, state: SI) -> Iterable[E]:
         """Return a set of events from a command and state.
 
         Parameters
@@ -73,7 +74,8 @@ class BaseDecider(ABC, Generic[E, C, SI, SO]):
             state: State of the current decider
 
         Returns
-            An iterator of events resulting from the command.
+            An iterable of events resulting from the command. This may be
+            a generator or a ready-made sequence such as a tuple.
         """
         pass
 
@@ -88,6 +90,49 @@ class Decider(BaseDecider[E, C, S, S], Generic[E, C, S]):
     pass
 
 
+class _ComposedDecider(
+    Decider[Either[EX, EY], Either[CX, CY], tuple[SX, SY]],
+    Generic[EX, CX, SX, EY, CY, SY],
+):
+    """Decider built by `ComposeDecider`."""
+
+    def __init__(self, dx: Decider[EX, CX, SX], dy: Decider[EY, CY, SY]) -> None:
+        self._dx = dx
+        self._dy = dy
+
+    @override
+    def decide(
+        self, command: Either[CX, CY], state: tuple[SX, SY]
+    ) -> Iterable[Either[EX, EY]]:
+        match command:
+            case Left():
+                return map(Left, self._dx.decide(command.value, state[0]))
+            case Right():
+                return map(Right, self._dy.decide(command.value, state[1]))
+            case _:
+                return ()
+
+    @override
+    def evolve(
+        self,
+        state: tuple[SX, SY],
+        event: Left[EX] | Right[EY],
+    ) -> tuple[SX, SY]:
+        match event:
+            case Left():
+                return (self._dx.evolve(state[0], event.value), state[1])
+            case Right():
+                return (state[0], self._dy.evolve(state[1], event.value))
+
+    @override
+    def initial_state(self) -> tuple[SX, SY]:
+        return (self._dx.initial_state(), self._dy.initial_state())
+
+    @override
+    def is_terminal(self, state: tuple[SX, SY]) -> bool:
+        return self._dx.is_terminal(state[0]) and self._dy.is_terminal(state[1])
+
+
 class ComposeDecider(Generic[EX, CX, SX, EY, CY, SY]):
     """Combine two deciders into a single decider.
 
@@ -118,65 +163,27 @@ class ComposeDecider(Generic[EX, CX, SX, EY, CY, SY]):
 
         Returns:
             A single decider made of two deciders."""
+        return _ComposedDecider(self._left_dx, self._right_dy)
+
+
+class _NeutralDecider(Decider[None, None, tuple[()]]):
+    """Decider built by `NeutralDecider`."""
+
+    @override
+    def decide(self, command: None, state: tuple[()]) -> Iterable[None]:
+        return ()
+
+    @override
+    def evolve(self, state: tuple[()], event: None) -> tuple[()]:
+        return ()
 
-        InnerEX = TypeVar("InnerEX")
-        InnerEY = TypeVar("InnerEY")
-        InnerCX = TypeVar("InnerCX")
-        InnerCY = TypeVar("InnerCY")
-        InnerSX = TypeVar("InnerSX")
-        InnerSY = TypeVar("InnerSY")
-
-        class InternalDecider(
-            Decider[
-                Either[InnerEX, InnerEY],
-                Either[InnerCX, InnerCY],
-                tuple[InnerSX, InnerSY],
-            ]
-        ):
-
-            def __init__(
-                self,
-                dx: Decider[InnerEX, InnerCX, InnerSX],
-                dy: Decider[InnerEY, InnerCY, InnerSY],
-            ) -> None:
-                self._dx = dx
-                self._dy = dy
-
-            @override
-            def decide(
-                self, command: Either[InnerCX, InnerCY], state: tuple[InnerSX, InnerSY]
-            ) -> Iterator[Either[InnerEX, InnerEY]]:
-                match command:
-                    case Left():
-                        yield from map(
-                            lambda v: Left(v), self._dx.decide(command.value, state[0])
-                        )
-                    case Right():
-                        yield from map(
-                            lambda v: Right(v), self._dy.decide(command.value, state[1])
-                        )
-
-            @override
-            def evolve(
-                self,
-                state: tuple[InnerSX, InnerSY],
-                event: Left[InnerEX] | Right[InnerEY],
-            ) -> tuple[InnerSX, InnerSY]:
-                match event:
-                    case Left():
-                        return (self._dx.evolve(state[0], event.value), state[1])
-                    case Right():
-                        return (state[0], self._dy.evolve(state[1], event.value))
-
-            @override
-            def initial_state(self) -> tuple[InnerSX, InnerSY]:
-                return (self._dx.initial_state(), self._dy.initial_state())
-
-            @override
-            def is_terminal(self, state: tuple[InnerSX, InnerSY]) -> bool:
-                return self._dx.is_terminal(state[0]) and self._dy.is_terminal(state[1])
-
-        return InternalDecider(self._left_dx, self._right_dy)
+    @override
+    def initial_state(self) -> tuple[()]:
+        return ()
+
+    @override
+    def is_terminal(self, state: tuple[()]) -> bool:
+        return True
 
 
 class NeutralDecider:
@@ -188,28 +195,58 @@ class NeutralDecider:
         Returns:
             A decider which is always terminal and returns nothing.
         """
+        return _NeutralDecider()
 
-        class InternalDecider(Decider[None, None, tuple[()]]):
-            @override
-            def decide(self, command: None, state: tuple[()]) -> Iterator[None]:
-                yield from []
 
-            @override
-            def evolve(self, state: tuple[()], event: None) -> tuple[()]:
-                return ()
+I = TypeVar("I")  # identifier
 
-            @override
-            def initial_state(self) -> tuple[()]:
-                return ()
 
-            @override
-            def is_terminal(self, state: tuple[()]) -> bool:
-                return True
+class _ManyDecider(
+    Decider[tuple[I, E], tuple[I, C], MutableMapping[I, S]], Generic[I, E, C, S]
+):
+    """Decider built by `ManyDecider`."""
 
-        return InternalDecider()
+    def __init__(self, decider: Decider[E, C, S]) -> None:
+        self.decider = decider
 
+    @override
+    def evolve(
+        self,
+        state: MutableMapping[I, S],
+        event: tuple[I, E],
+    ) -> MutableMapping[I, S]:
+        identifier, current_event = event
+        try:
+            current_state = state[identifier]
+        except KeyError:
+            current_state = self.decider.initial_state()
+
+        state[identifier] = self.decider.evolve(current_state, current_event)
+        return state
+
+    @override
+    def decide(
+        self,
+        command: tuple[I, C],
+        state: MutableMapping[I, S],
+    ) -> Iterable[tuple[I, E]]:
+        identifier, current_command = command
+        try:
+            current_state = state[identifier]
+        except KeyError:
+            current_state = self.decider.initial_state()
+
+        return zip(
+            repeat(identifier), self.decider.decide(current_command, current_state)
+        )
 
-I = TypeVar("I")  # identifier
+    @override
+    def is_terminal(self, state: MutableMapping[I, S]) -> bool:
+        return all(map(self.decider.is_terminal, state.values()))
+
+    @override
+    def initial_state(self) -> MutableMapping[I, S]:
+        return {}
 
 
 class ManyDecider(Generic[I]):
@@ -224,89 +261,61 @@ class ManyDecider(Generic[I]):
     desired command to be executed.
     """
 
-    def _build(self):
-        """Returns a many decider decider.
+    def __init__(self, identifier_type: Type[I]) -> None:
+        self.identifier_type = identifier_type
+
+    def build(
+        self, decider: Decider[E, C, S]
+    ) -> Decider[tuple[I, E], tuple[I, C], MutableMapping[I, S]]:
+        """Returns a decider managing many instances of `decider`.
+
+        Parameters:
+            decider: The decider we are holding multiples of.
 
         Returns:
-            A decider which is always terminal and returns nothing.
+            A decider whose commands and events are tagged with an identifier.
         """
-        InnerI = TypeVar("InnerI")
-        InnerE = TypeVar("InnerE")
-        InnerC = TypeVar("InnerC")
-        InnerS = TypeVar("InnerS")
-
-        class InternalDecider(
-            Decider[
-                tuple[InnerI, InnerE],
-                tuple[InnerI, InnerC],
-                MutableMapping[InnerI, InnerS],
-            ],
-            Generic[InnerI, InnerE, InnerC, InnerS],
-        ):
-            def __init__(self, decider: Decider[InnerE, InnerC, InnerS]) -> None:
-                """Create an instance of ManyDecider.
-
-                Parameters:
-                    decider: The type of decider we are holding multiples of.
-                """
-                self.decider = decider
-
-            @override
-            def evolve(
-                self,
-                state: MutableMapping[InnerI, InnerS],
-                event: tuple[InnerI, InnerE],
-            ) -> MutableMapping[InnerI, InnerS]:
-
-                identifier = event[0]
-                current_event = event[1]
-
-                current_state = state.get(identifier)
-                if current_state is None:
-                    current_state = self.decider.initial_state()
-
-                current_state = self.decider.evolve(current_state, current_event)
-                state[identifier] = current_state
-
-                return state
-
-            @override
-            def decide(
-                self,
-                command: tuple[InnerI, InnerC],
-                state: MutableMapping[InnerI, InnerS],
-            ) -> Iterator[tuple[InnerI, InnerE]]:
-                identifier = command[0]
-                current_command = command[1]
-
-                current_state = state.get(identifier)
-                if current_state is None:
-                    current_state = self.decider.initial_state()
-
-                yield from map(
-                    lambda event: (identifier, event),
-                    self.decider.decide(current_command, current_state),
-                )
-
-            @override
-            def is_terminal(self, state: MutableMapping[InnerI, InnerS]) -> bool:
-                for member_state in state.values():
-                    if not self.decider.is_terminal(member_state):
-                        return False
-                return True
-
-            @override
-            def initial_state(self) -> MutableMapping[InnerI, InnerS]:
-                return {}
-
-        def constructor(decider: Decider[InnerE, InnerC, InnerS]):
-            return InternalDecider[I, InnerE, InnerC, InnerS](decider)
-
-        return constructor
+        return _ManyDecider(decider)
 
-    def __init__(self, identifier_type: Type[I]) -> None:
-        self.identifier_type = identifier_type
-        self.build = self._build()
+
+class _AdaptedDecider(BaseDecider[E, C, S, SO], Generic[E, C, S, SO, CO, EO]):
+    """Decider built by `AdaptDecider`."""
+
+    def __init__(
+        self,
+        fci: Callable[[C], CO | None],
+        fei: Callable[[E], EO | None],
+        feo: Callable[[EO], E],
+        fsi: Callable[[S], SO],
+        decider: Decider[EO, CO, SO],
+    ) -> None:
+        self._fci = fci
+        self._fei = fei
+        self._feo = feo
+        self._fsi = fsi
+        self._decider = decider
+
+    @override
+    def decide(self, command: C, state: S) -> Iterable[E]:
+        new_command = self._fci(command)
+        if new_command is None:
+            return ()
+        return map(self._feo, self._decider.decide(new_command, self._fsi(state)))
+
+    @override
+    def evolve(self, state: S, event: E) -> SO:
+        new_event = self._fei(event)
+        if new_event is None:
+            return self._fsi(state)
+        return self._decider.evolve(self._fsi(state), new_event)
+
+    @override
+    def initial_state(self) -> SO:
+        return self._decider.initial_state()
+
+    @override
+    def is_terminal(self, state: S) -> bool:
+        return self._decider.is_terminal(self._fsi(state))
 
 
 class AdaptDecider(Generic[E, C, S, EO, CO, SO]):
@@ -353,60 +362,35 @@ class AdaptDecider(Generic[E, C, S, EO, CO, SO]):
         Returns:
             A Decider with its functions wrapped by translation functions.
         """
-        InnerE = TypeVar("InnerE")
-        InnerC = TypeVar("InnerC")
-        InnerS = TypeVar("InnerS")
-        InnerSO = TypeVar("InnerSO")
-        InnerCO = TypeVar("InnerCO")
-        InnerEO = TypeVar("InnerEO")
-
-        class InternalDecider(
-            BaseDecider[InnerE, InnerC, InnerS, InnerSO],
-            Generic[InnerE, InnerC, InnerS, InnerSO, InnerCO, InnerEO],
-        ):
-            @override
-            def decide(self, command: InnerC, state: InnerS) -> Iterator[InnerE]:
-                new_command = self._fci(command)
-                if new_command is None:
-                    return
-                yield from map(
-                    self._feo, self._decider.decide(new_command, self._fsi(state))
-                )
-
-            @override
-            def evolve(self, state: InnerS, event: InnerE) -> InnerSO:
-                new_event = self._fei(event)
-                if new_event is None:
-                    return self._fsi(state)
-                return self._decider.evolve(self._fsi(state), new_event)
-
-            @override
-            def initial_state(self) -> InnerSO:
-                return self._decider.initial_state()
-
-            @override
-            def is_terminal(self, state: InnerS) -> bool:
-                return self._decider.is_terminal(self._fsi(state))
-
-            def __init__(
-                self,
-                fci: Callable[[InnerC], InnerCO | None],
-                fei: Callable[[InnerE], InnerEO | None],
-                feo: Callable[[InnerEO], InnerE],
-                fsi: Callable[[InnerS], InnerSO],
-                decider: Decider[InnerEO, InnerCO, InnerSO],
-            ) -> None:
-                self._fci = fci
-                self._fei = fei
-                self._feo = feo
-                self._fsi = fsi
-                self._decider = decider
-
-        return InternalDecider(
+        return _AdaptedDecider(
             self._fci, self._fei, self._feo, self._fsi, self._decider
         )
 
 
+class _MappedDecider(BaseDecider[E, C, SI, SB], Generic[E, C, SI, SA, SB]):
+    """Decider built by `MapDecider`."""
+
+    def __init__(self, f: Callable[[SA], SB], d: BaseDecider[E, C, SI, SA]) -> None:
+        self._f = f
+        self._d = d
+
+    @override
+    def decide(self, command: C, state: SI) -> Iterable[E]:
+        return self._d.decide(command, state)
+
+    @override
+    def evolve(self, state: SI, event: E) -> SB:
+        return self._f(self._d.evolve(state, event))
+
+    @override
+    def initial_state(self) -> SB:
+        return self._f(self._d.initial_state())
+
+    @override
+    def is_terminal(self, state: SI) -> bool:
+        return self._d.is_terminal(state)
+
+
 class MapDecider(Generic[E, C, SI, SA, SB]):
     """Map allows the translation of a Decider's state into a different state."""
 
@@ -427,38 +411,39 @@ class MapDecider(Generic[E, C, SI, SA, SB]):
             A new Decider where `evolve` and `initial_state` both
             return `f(state_operation)`.
         """
-        InnerE = TypeVar("InnerE")
-        InnerC = TypeVar("InnerC")
-        InnerSI = TypeVar("InnerSI")
-        InnerSA = TypeVar("InnerSA")
-        InnerSB = TypeVar("InnerSB")
+        return _MappedDecider(self._f, self._d)
+
 
-        class InternalDecider(BaseDecider[InnerE, InnerC, InnerSI, InnerSB]):
-            @override
-            def decide(self, command: InnerC, state: InnerSI) -> Iterator[InnerE]:
-                yield from self._d.decide(command, state)
+class _Mapped2Decider(BaseDecider[E, C, SI, S], Generic[E, C, S, SX, SY, SI]):
+    """Decider built by `Map2Decider`."""
 
-            @override
-            def evolve(self, state: InnerSI, event: InnerE) -> InnerSB:
-                return self._f(self._d.evolve(state, event))
+    def __init__(
+        self,
+        f: Callable[[SX, SY], S],
+        dx: BaseDecider[E, C, SI, SX],
+        dy: BaseDecider[E, C, SI, SY],
+    ) -> None:
+        self._f = f
+        self._dx = dx
+        self._dy = dy
 
-            @override
-            def initial_state(self) -> InnerSB:
-                return self._f(self._d.initial_state())
+    @override
+    def decide(self, command: C, state: SI) -> Iterable[E]:
+        return chain(self._dx.decide(command, state), self._dy.decide(command, state))
 
-            @override
-            def is_terminal(self, state: InnerSI) -> bool:
-                return self._d.is_terminal(state)
+    @override
+    def evolve(self, state: SI, event: E) -> S:
+        sx = self._dx.evolve(state, event)
+        sy = self._dy.evolve(state, event)
+        return self._f(sx, sy)
 
-            def __init__(
-                self,
-                f: Callable[[InnerSA], InnerSB],
-                d: BaseDecider[InnerE, InnerC, InnerSI, InnerSA],
-            ) -> None:
-                self._f = f
-                self._d = d
+    @override
+    def initial_state(self) -> S:
+        return self._f(self._dx.initial_state(), self._dy.initial_state())
 
-        return InternalDecider(self._f, self._d)
+    @override
+    def is_terminal(self, state: SI) -> bool:
+        return self._dx.is_terminal(state) and self._dy.is_terminal(state)
 
 
 class Map2Decider(Generic[E, C, S, SX, SY, SI]):
@@ -473,42 +458,4 @@ class Map2Decider(Generic[E, C, S, SX, SY, SI]):
         self._dy = dy
 
     def build(self) -> BaseDecider[E, C, SI, S]:
-
-        InnerE = TypeVar("InnerE")
-        InnerC = TypeVar("InnerC")
-        InnerS = TypeVar("InnerS")
-        InnerSX = TypeVar("InnerSX")
-        InnerSY = TypeVar("InnerSY")
-        InnerSI = TypeVar("InnerSI")
-
-        class InternalDecider(BaseDecider[InnerE, InnerC, InnerSI, InnerS]):
-            @override
-            def decide(self, command: InnerC, state: InnerSI) -> Iterator[InnerE]:
-                yield from self._dx.decide(command, state)
-                yield from self._dy.decide(command, state)
-
-            @override
-            def evolve(self, state: InnerSI, event: InnerE) -> InnerS:
-                sx = self._dx.evolve(state, event)
-                sy = self._dy.evolve(state, event)
-                return self._f(sx, sy)
-
-            @override
-            def initial_state(self) -> InnerS:
-                return self._f(self._dx.initial_state(), self._dy.initial_state())
-
-            @override
-            def is_terminal(self, state: InnerSI) -> bool:
-                return self._dx.is_terminal(state) and self._dy.is_terminal(state)
-
-            def __init__(
-                self,
-                f: Callable[[InnerSX, InnerSY], InnerS],
-                dx: BaseDecider[InnerE, InnerC, InnerSI, InnerSX],
-                dy: BaseDecider[InnerE, InnerC, InnerSI, InnerSY],
-            ) -> None:
-                self._f = f
-                self._dx = dx
-                self._dy = dy
-
-        return InternalDecider(self._f, self._dx, self._dy)
+        return _Mapped2Decider(self._f, self._dx, self._dy)
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Iterator
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
 from typing import Generic, TypeVar, override
 
 from pycider.deciders import Decider
@@ -29,27 +30,29 @@ class IProcess(ABC, Generic[E, C, S]):
         pass
 
     @abstractmethod
-    def resume(self, state: S) -> Iterator[C]:
-        """Returns an iterator of commands to resume a process from a given state.
+    def resume(self, state: S) -> Iterable[C]:
+        """Returns the commands to resume a process from a given state.
 
         Parameters
             state: State of the current process
 
         Returns
-            An iterator of commands to act on.
+            An iterable of commands to act on, either a generator or a
+            ready-made sequence such as a tuple.
         """
         pass
 
     @abstractmethod
-    def react(self, state: S, event: E) -> Iterator[C]:
-        """Returns an iterator of commands as a reaction to an event.
+    def react(self, state: S, event: E) -> Iterable[C]:
+        """Returns the commands to issue as a reaction to an event.
 
         Parameters
             state: State of the current process
             event: Event currently being processed
 
         Returns
-            An iterator of commands to act on.
+            An iterable of commands to act on, either a generator or a
+            ready-made sequence such as a tuple.
         """
         pass
 
@@ -81,6 +84,46 @@ EO = TypeVar("EO")
 CO = TypeVar("CO")
 
 
+class _AdaptedProcess(IProcess[EI, CI, S], Generic[EI, CI, S, EO, CO]):
+    """Process built by `ProcessAdapt`."""
+
+    def __init__(
+        self,
+        process: IProcess[EO, CO, S],
+        event_converter: Callable[[EI], EO | None],
+        command_converter: Callable[[CO], CI],
+    ) -> None:
+        self._process = process
+        self._event_converter = event_converter
+        self._command_converter = command_converter
+
+    @override
+    def evolve(self, state: S, event: EI) -> S:
+        new_event = self._event_converter(event)
+        if new_event is None:
+            return state
+        return self._process.evolve(state, new_event)
+
+    @override
+    def resume(self, state: S) -> Iterable[CI]:
+        return map(self._command_converter, self._process.resume(state))
+
+    @override
+    def react(self, state: S, event: EI) -> Iterable[CI]:
+        new_event = self._event_converter(event)
+        if new_event is None:
+            return ()
+        return map(self._command_converter, self._process.react(state, new_event))
+
+    @override
+    def initial_state(self) -> S:
+        return self._process.initial_state()
+
+    @override
+    def is_terminal(self, state: S) -> bool:
+        return self._process.is_terminal(state)
+
+
 class ProcessAdapt(Generic[EI, CI, S, EO, CO]):
     """Adapt process Commands / Events into new output Commands and Events."""
 
@@ -106,70 +149,75 @@ class ProcessAdapt(Generic[EI, CI, S, EO, CO]):
         Returns:
             A new Process that can given input Events/Commands return new output variants.
         """
-        InnerEI = TypeVar("InnerEI")
-        InnerEO = TypeVar("InnerEO")
-        InnerCO = TypeVar("InnerCO")
-        InnerCI = TypeVar("InnerCI")
-        InnerS = TypeVar("InnerS")
-
-        class InternalProcess(IProcess[InnerEI, InnerCI, InnerS]):
-            @override
-            def evolve(self, state: InnerS, event: InnerEI) -> InnerS:
-                new_event = self._event_converter(event)
-                if new_event is None:
-                    return state
-                return self._process.evolve(state, new_event)
-
-            @override
-            def resume(self, state: InnerS) -> Iterator[InnerCI]:
-                yield from map(self._command_converter, self._process.resume(state))
-
-            @override
-            def react(self, state: InnerS, event: InnerEI) -> Iterator[InnerCI]:
-                new_event = self._event_converter(event)
-                if new_event is None:
-                    yield from []
-                else:
-                    yield from map(
-                        self._command_converter, self._process.react(state, new_event)
-                    )
-
-            @override
-            def initial_state(self) -> InnerS:
-                return self._process.initial_state()
-
-            @override
-            def is_terminal(self, state: InnerS) -> bool:
-                return self._process.is_terminal(state)
-
-            def __init__(
-                self,
-                process: IProcess[InnerEO, InnerCO, InnerS],
-                event_converter: Callable[[InnerEI], InnerEO | None],
-                command_converter: Callable[[InnerCO], InnerCI],
-            ) -> None:
-                self._process = process
-                self._event_converter = event_converter
-                self._command_converter = command_converter
-
-        return InternalProcess(self._p, self._select_event, self._convert_command)
+        return _AdaptedProcess(self._p, self._select_event, self._convert_command)
 
 
 def process_collect_fold(
-    proc: IProcess[E, C, S], state: S, events: list[E]
-) -> Iterator[C]:
-    new_state = state
-    while len(events) > 0:
-        event = events.pop(0)
-        new_state = proc.evolve(state, event)
-        commands = proc.react(new_state, event)
-        yield from commands
+    proc: IProcess[E, C, S], state: S, events: Iterable[E]
+) -> list[C]:
+    """Fold events through a process, collecting the commands it reacts with.
+
+    Parameters:
+        proc: The process reacting to the events.
+        state: State of the process before the first event.
+        events: Events to evolve the process with, in order.
+
+    Returns:
+        The commands issued in reaction to each event, in order.
+    """
+    commands: list[C] = []
+    evolve, react, extend = proc.evolve, proc.react, commands.extend
+    for event in events:
+        state = evolve(state, event)
+        extend(react(state, event))
+    return commands
 
 
 PS = TypeVar("PS")
 DS = TypeVar("DS")
 
 
+class _CombinedDecider(Decider[E, C, tuple[DS, PS]], Generic[E, C, PS, DS]):
+    """Decider built by `ProcessCombineWithDecider`."""
+
+    def __init__(self, process: IProcess[E, C, PS], decision: Decider[E, C, DS]):
+        self._proc = process
+        self._decider = decision
+
+    @override
+    def decide(self, command: C, state: tuple[DS, PS]) -> Iterator[E]:
+        decide, decider_evolve = self._decider.decide, self._decider.evolve
+        process_evolve, react = self._proc.evolve, self._proc.react
+        # NOTE: This is a deviation.
+        decider_state, process_state = state
+        commands = deque([command])
+        while commands:
+            new_events = list(decide(commands.popleft(), decider_state))
+            # The process state is carried across follow-up commands just
+            # like the decider state, so every reaction sees all the events
+            # decided before it.
+            for event in new_events:
+                decider_state = decider_evolve(decider_state, event)
+                process_state = process_evolve(process_state, event)
+                commands.extend(react(process_state, event))
+            yield from new_events
+
+    @override
+    def evolve(self, state: tuple[DS, PS], event: E) -> tuple[DS, PS]:
+        return (
+            self._decider.evolve(state[0], event),
+            self._proc.evolve(state[1], event),
+        )
+
+    @override
+    def initial_state(self) -> tuple[DS, PS]:
+        return (self._decider.initial_state(), self._proc.initial_state())
+
+    @override
+    def is_terminal(self, state: tuple[DS, PS]) -> bool:
+        return self._decider.is_terminal(state[0]) and self._proc.is_terminal(state[1])
+
+
 class ProcessCombineWithDecider(Generic[E, C, PS, DS]):
     """Combine a Processor with a Decider together."""
 
@@ -200,63 +248,10 @@ class ProcessCombineWithDecider(Generic[E, C, PS, DS]):
         #. create a copy of state and run `decider.evolve` on it
         #. run `process.react` to generate new commands appended to the commands list.
         #. run `process.evolve` on each new event.
-        #. loop back to 2 with remaining commands and the copy of decider's state.
+        #. loop back to 2 with remaining commands and the copies of the decider's and process's states.
         #. one commands is empty, return all events collected during the above.
 
         The state of neither process nor decider is actually changed by `decide`. You will still need to call `evolve` to reach the final end states.
         """
 
-        InnerE = TypeVar("InnerE")  # Event type for the inner class
-        InnerC = TypeVar("InnerC")  # Command type for the inner class
-        InnerPS = TypeVar("InnerPS")  # Process state type for the inner class
-        InnerDS = TypeVar("InnerDS")  # Decider state type for the inner class
-
-        class InternalDecider(Decider[InnerE, InnerC, tuple[InnerDS, InnerPS]]):
-            def __init__(
-                self,
-                process: IProcess[InnerE, InnerC, InnerPS],
-                decision: Decider[InnerE, InnerC, InnerDS],
-            ):
-                self._proc = process
-                self._decider = decision
-
-            @override
-            def decide(
-                self, command: InnerC, state: tuple[InnerDS, InnerPS]
-            ) -> Iterator[InnerE]:
-
-                # NOTE: This is a deviation.
-                decider_state = state[0]
-                commands = [command]
-                while len(commands) > 0:
-                    command = commands.pop(0)
-                    new_events = list(self._decider.decide(command, decider_state))
-                    # NOTE: This is a deviation.
-                    for event in new_events:
-                        decider_state = self._decider.evolve(decider_state, event)
-                    new_commands = process_collect_fold(
-                        self._proc, state[1], new_events.copy()
-                    )
-                    commands.extend(new_commands)
-                    yield from new_events
-
-            @override
-            def evolve(
-                self, state: tuple[InnerDS, InnerPS], event: InnerE
-            ) -> tuple[InnerDS, InnerPS]:
-                return (
-                    self._decider.evolve(state[0], event),
-                    self._proc.evolve(state[1], event),
-                )
-
-            @override
-            def initial_state(self) -> tuple[InnerDS, InnerPS]:
-                return (self._decider.initial_state(), self._proc.initial_state())
-
-            @override
-            def is_terminal(self, state: tuple[InnerDS, InnerPS]) -> bool:
-                return self._decider.is_terminal(state[0]) and self._proc.is_terminal(
-                    state[1]
-                )
-
-        return InternalDecider(self._proc, self._decider)
+        return _CombinedDecider(self._proc, self._decider)
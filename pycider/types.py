@@ -7,6 +7,7 @@ TB = TypeVar("TB")
 class Left(Generic[TA]):
     """Left-hand side container that holds a value."""
 
+    __slots__ = ("value",)
     __match_args__ = ("value",)
 
     def __init__(self, value: TA) -> None:
@@ -21,6 +22,7 @@ class Left(Generic[TA]):
 class Right(Generic[TB]):
     """Right-hand side container that holds a value."""
 
+    __slots__ = ("value",)
     __match_args__ = ("value",)
 
     def __init__(self, value: TB) -> None:
@@ -1,4 +1,4 @@
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from typing import Generic, Sequence, TypeVar
 
 from pycider.deciders import Decider
@@ -20,6 +20,13 @@ class InMemory(Generic[E, C, S]):
         self._decider = decider
         self.state: S = self._decider.initial_state()  #: State of the decider
 
+    def reset(self) -> None:
+        """Return the executor to the decider's initial state.
+
+        This allows an executor to be reused without rebuilding the decider.
+        """
+        self.state = self._decider.initial_state()
+
     def command(self, command: C) -> Iterator[E]:
         """Decide over a command and evolves the internal state.
 
@@ -43,4 +50,33 @@ class InMemory(Generic[E, C, S]):
         Returns:
             A sequence of events
         """
-        return list(self.command(command))
+        decider = self._decider
+        state = self.state
+        events = list(decider.decide(command, state))
+        for event in events:
+            state = decider.evolve(state, event)
+        self.state = state
+        return events
+
+    def batch(self, commands: Iterable[C]) -> Sequence[E]:
+        """Decide over several commands in order, evolving the internal state.
+
+        This gives the same events and final state as calling the executor
+        with each command in turn, without a call per command.
+
+        Parameters:
+            commands: Commands to decide over, in order
+
+        Returns:
+            A sequence of the events for all commands
+        """
+        decide, evolve = self._decider.decide, self._decider.evolve
+        state = self.state
+        events: list[E] = []
+        for command in commands:
+            new_events = list(decide(command, state))
+            for event in new_events:
+                state = evolve(state, event)
+            events.extend(new_events)
+        self.state = state
+        return events
@@ -1,22 +1,26 @@
 import dataclasses
-from abc import ABC
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 
 from pycider.deciders import ComposeDecider, Decider, ManyDecider
-from pycider.processes import IProcess, ProcessAdapt, ProcessCombineWithDecider
+from pycider.processes import (
+    IProcess,
+    ProcessAdapt,
+    ProcessCombineWithDecider,
+    process_collect_fold,
+)
 from pycider.types import Either, Left, Right
 from pycider.utils import InMemory
 
 
-class CatLightState(ABC):
+class CatLightState:
     pass
 
 
-class CatLightEvent(ABC):
+class CatLightEvent:
     pass
 
 
-class CatLightCommand(ABC):
+class CatLightCommand:
     pass
 
 
@@ -53,35 +57,62 @@ class CatLight(IProcess[CatLightEvent, CatLightCommand, CatLightState]):
     def resume(self, state: CatLightState) -> Iterator[CatLightCommand]:
         match state:
             case CatLightStateWakingUp():
-                yield from [CatLightCommandWakeUp()]
+                yield CatLightCommandWakeUp()
             case _:
-                yield from []
+                return
 
     def react(
         self, state: CatLightState, event: CatLightEvent
     ) -> Iterator[CatLightCommand]:
         match state, event:
             case CatLightStateWakingUp(), CatLightEventSwitchedOn():
-                yield from [CatLightCommandWakeUp()]
+                yield CatLightCommandWakeUp()
             case _:
-                yield from []
+                return
 
     def initial_state(self) -> CatLightState:
         return CatLightStateIdle()
 
     def is_terminal(self, state: CatLightState) -> bool:
-        return isinstance(state, CatLightStateIdle)
+        return type(state) is CatLightStateIdle
 
 
-class CatState(ABC):
+class CatLightCounter(IProcess[CatLightEvent, CatLightCommand, int]):
+    """Wakes the cat up on every second time the light is switched on."""
+
+    def evolve(self, state: int, event: CatLightEvent) -> int:
+        match event:
+            case CatLightEventSwitchedOn():
+                return state + 1
+            case _:
+                return state
+
+    def resume(self, state: int) -> Iterable[CatLightCommand]:
+        return ()
+
+    def react(self, state: int, event: CatLightEvent) -> Iterator[CatLightCommand]:
+        match event:
+            case CatLightEventSwitchedOn() if state % 2 == 0:
+                yield CatLightCommandWakeUp()
+            case _:
+                return
+
+    def initial_state(self) -> int:
+        return 0
+
+    def is_terminal(self, state: int) -> bool:
+        return False
+
+
+class CatState:
     pass
 
 
-class CatEvent(ABC):
+class CatEvent:
     pass
 
 
-class CatCommand(ABC):
+class CatCommand:
     pass
 
 
@@ -120,11 +151,11 @@ class Cat(Decider[CatEvent, CatCommand, CatState]):
     def decide(self, command: CatCommand, state: CatState) -> Iterator[CatEvent]:
         match (command, state):
             case (CatCommandWakeUp(), CatStateAsleep()):
-                yield from [CatEventWokeUp()]
+                yield CatEventWokeUp()
             case CatCommandGetToSleep(), CatStateAwake():
-                yield from [CatEventGotToSleep()]
+                yield CatEventGotToSleep()
             case _:
-                yield from []
+                return
 
     def evolve(self, state: CatState, event: CatEvent) -> CatState:
         match (state, event):
@@ -136,65 +167,65 @@ class Cat(Decider[CatEvent, CatCommand, CatState]):
                 return state
 
 
-class BulbState(ABC):
-    pass
+class BulbState:
+    __slots__ = ()
 
 
-class BulbEvent(ABC):
-    pass
+class BulbEvent:
+    __slots__ = ()
 
 
-class BulbCommand(ABC):
-    pass
+class BulbCommand:
+    __slots__ = ()
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(slots=True, frozen=True)
 class BulbCommandFit(BulbCommand):
     max_uses: int
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(slots=True, frozen=True)
 class BulbCommandSwitchOn(BulbCommand):
     pass
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(slots=True, frozen=True)
 class BulbCommandSwitchOff(BulbCommand):
     pass
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(slots=True, frozen=True)
 class BulbEventFitted(BulbEvent):
     max_uses: int
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(slots=True, frozen=True)
 class BulbEventSwitchedOn(BulbEvent):
     pass
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(slots=True, frozen=True)
 class BulbEventSwitchedOff(BulbEvent):
     pass
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(slots=True, frozen=True)
 class BulbEventBlew(BulbEvent):
     pass
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(slots=True, frozen=True)
 class BulbStateNotFitted(BulbState):
     pass
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(slots=True, frozen=True)
 class BulbStateWorking(BulbState):
     is_on: bool
     remaining_uses: int
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(slots=True, frozen=True)
 class BulbStateBlown(BulbState):
     pass
 
@@ -203,17 +234,17 @@ class Bulb(Decider[BulbEvent, BulbCommand, BulbState]):
     def decide(self, command: BulbCommand, state: BulbState) -> Iterator[BulbEvent]:
         match command, state:
             case BulbCommandFit(), BulbStateNotFitted():
-                yield from [BulbEventFitted(max_uses=command.max_uses)]
+                yield BulbEventFitted(max_uses=command.max_uses)
             case BulbCommandSwitchOn(), BulbStateWorking(
                 is_on=False, remaining_uses=remaining_uses
             ) if remaining_uses > 0:
-                yield from [BulbEventSwitchedOn()]
+                yield BulbEventSwitchedOn()
             case BulbCommandSwitchOn(), BulbStateWorking(is_on=False):
-                yield from [BulbEventBlew()]
+                yield BulbEventBlew()
             case BulbCommandSwitchOff(), BulbStateWorking(is_on=True):
-                yield from [BulbEventSwitchedOff()]
+                yield BulbEventSwitchedOff()
             case _:
-                yield from []
+                return
 
     def evolve(self, state: BulbState, event: BulbEvent) -> BulbState:
         match state, event:
@@ -236,7 +267,36 @@ class Bulb(Decider[BulbEvent, BulbCommand, BulbState]):
         return BulbStateNotFitted()
 
     def is_terminal(self, state: BulbState) -> bool:
-        return isinstance(state, BulbStateBlown)
+        return type(state) is BulbStateBlown
+
+
+class BulbFlicker(IProcess[BulbEvent, BulbCommand, int]):
+    """Switches the bulb off whenever it is on, and back on until twice."""
+
+    def evolve(self, state: int, event: BulbEvent) -> int:
+        match event:
+            case BulbEventSwitchedOn():
+                return state + 1
+            case _:
+                return state
+
+    def resume(self, state: int) -> Iterable[BulbCommand]:
+        return ()
+
+    def react(self, state: int, event: BulbEvent) -> Iterator[BulbCommand]:
+        match event:
+            case BulbEventSwitchedOn():
+                yield BulbCommandSwitchOff()
+            case BulbEventSwitchedOff() if state < 2:
+                yield BulbCommandSwitchOn()
+            case _:
+                return
+
+    def initial_state(self) -> int:
+        return 0
+
+    def is_terminal(self, state: int) -> bool:
+        return state >= 2
 
 
 def test_cat_and_bulb() -> None:
@@ -308,3 +368,76 @@ def test_compose_process() -> None:
     assert cat_b.state[0][1].is_on is False
     assert cat_b.state[0][1].remaining_uses == 4
     assert type(cat_b.state[1]) is CatLightStateWakingUp
+
+
+def test_process_state_carries_across_follow_up_commands() -> None:
+    flicker = InMemory(ProcessCombineWithDecider(BulbFlicker(), Bulb()).build())
+
+    flicker(BulbCommandFit(max_uses=5))
+    events = list(flicker(BulbCommandSwitchOn()))
+
+    # Each reaction is a follow-up command deciding a single event, so the
+    # flicker only stops if it sees the switch ons of the earlier commands.
+    assert events == [
+        BulbEventSwitchedOn(),
+        BulbEventSwitchedOff(),
+        BulbEventSwitchedOn(),
+        BulbEventSwitchedOff(),
+    ]
+    assert flicker.state == (BulbStateWorking(is_on=False, remaining_uses=3), 2)
+
+
+def test_in_memory_reset() -> None:
+    cat = InMemory(Cat())
+
+    cat(CatCommandGetToSleep())
+    assert type(cat.state) is CatStateAsleep
+
+    cat.reset()
+    assert type(cat.state) is CatStateAwake
+
+
+def test_process_collect_fold() -> None:
+    counter = CatLightCounter()
+    events = [
+        CatLightEventSwitchedOn(),
+        CatLightEventWokeUp(),
+        CatLightEventSwitchedOn(),
+        CatLightEventSwitchedOn(),
+        CatLightEventSwitchedOn(),
+    ]
+
+    commands = process_collect_fold(counter, counter.initial_state(), events)
+
+    # The counter only reacts on every second switch on, so commands are
+    # issued only if each event sees the state evolved by the ones before it.
+    assert [type(command) for command in commands] == [
+        CatLightCommandWakeUp,
+        CatLightCommandWakeUp,
+    ]
+    assert len(events) == 5
+
+
+def test_in_memory_batch() -> None:
+    commands = [
+        BulbCommandFit(max_uses=2),
+        BulbCommandSwitchOn(),
+        BulbCommandSwitchOff(),
+        BulbCommandSwitchOff(),
+        BulbCommandSwitchOn(),
+    ]
+    one_by_one = InMemory(Bulb())
+    batched = InMemory(Bulb())
+
+    expected = [event for command in commands for event in one_by_one(command)]
+    events = batched.batch(commands)
+
+    assert list(events) == expected
+    assert expected == [
+        BulbEventFitted(max_uses=2),
+        BulbEventSwitchedOn(),
+        BulbEventSwitchedOff(),
+        BulbEventSwitchedOn(),
+    ]
+    assert batched.state == one_by_one.state
+    assert batched.state == BulbStateWorking(is_on=True, remaining_uses=0)